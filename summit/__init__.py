@@ -1,3 +1,4 @@
+import importlib
 import pathlib
 import shutil
 
@@ -14,12 +15,62 @@ def clean_house(config_dir_name=".summit"):
     shutil.rmtree(config_path)
 
 
-from summit.benchmarks import *
-from summit.domain import *
-from summit.experiment import *
-# from summit.run import *
-from summit.utils.dataset import DataSet
-from summit.utils.multiobjective import hypervolume, pareto_efficient
+# Public names are loaded on first access (PEP 562) so that ``import summit``
+# does not pull in torch, sklearn etc. until they are actually needed.
+_LAZY = {
+    # summit.benchmarks
+    "ExperimentalEmulator": "summit.benchmarks",
+    "ANNRegressor": "summit.benchmarks",
+    "get_bnn": "summit.benchmarks",
+    "RegressorRegistry": "summit.benchmarks",
+    "registry": "summit.benchmarks",
+    "get_pretrained_reizman_suzuki_emulator": "summit.benchmarks",
+    "get_pretrained_baumgartner_cc_emulator": "summit.benchmarks",
+    "ReizmanSuzukiEmulator": "summit.benchmarks",
+    "BaumgartnerCrossCouplingEmulator": "summit.benchmarks",
+    "DTLZ2": "summit.benchmarks",
+    "VLMOP2": "summit.benchmarks",
+    "Hartmann3D": "summit.benchmarks",
+    "Himmelblau": "summit.benchmarks",
+    "ThreeHumpCamel": "summit.benchmarks",
+    # summit.domain
+    "Variable": "summit.domain",
+    "ContinuousVariable": "summit.domain",
+    "CategoricalVariable": "summit.domain",
+    "Constraint": "summit.domain",
+    "Domain": "summit.domain",
+    "DomainError": "summit.domain",
+    # summit.experiment
+    "Experiment": "summit.experiment",
+    # summit.run
+    # "Runner": "summit.run",
+    # "NeptuneRunner": "summit.run",
+    # summit.utils
+    "DataSet": "summit.utils.dataset",
+    "hypervolume": "summit.utils.multiobjective",
+    "pareto_efficient": "summit.utils.multiobjective",
+}
+
+_SUBMODULES = {"benchmarks", "domain", "experiment", "utils"}
+
+__all__ = ["get_summit_config_path", "clean_house", "run_tests"] + list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name])
+        value = getattr(module, name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache so __getattr__ is only hit once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 
 def run_tests():
@@ -94,13 +94,15 @@ class MIT_case5(Experiment):
 
     def _integrate_equations(self, conc_cat, t, cat_index, T):
         # Initial Concentrations in mM
-        self.C_i = np.zeros(6)
-        self.C_i[0] = 0.167  # Initial conc of A
-        self.C_i[1] = 0.250  # Initial conc of B
-        self.C_i[2] = conc_cat  # Initial conc of cat
+        C_i = np.zeros(6)
+        C_i[0] = 0.167  # Initial conc of A
+        C_i[1] = 0.250  # Initial conc of B
+        C_i[2] = conc_cat  # Initial conc of cat
 
         # Integrate
-        res = solve_ivp(self._integrand, [0, t], self.C_i, args=(cat_index, T))
+        # Rate constants are fixed over the integration
+        k = self._rate_constants(conc_cat, cat_index, T)
+        res = solve_ivp(self._integrand, [0, t], C_i, args=(k,))
         C_final = res.y[:, -1]
 
         # Add measurment noise
@@ -113,15 +115,19 @@ class MIT_case5(Experiment):
 
         # calculate yield
         # M = [159.09, 71.12, 210.21, 210.21, 261.33]  # molecular weights (g/mol)
-        y = C_final[3] / self.C_i[0]
+        y = C_final[3] / C_i[0]
         return y, res
 
-    def _integrand(self, t, C, cat_index, T):
+    def _rate_constants(self, conc_cat, cat_index, T):
+        """Rate constants for the main (R) and side (S1, S2) reactions
+
+        The catalyst is not consumed (r[2] = 0), so C[2] stays at conc_cat
+        and the rate constants do not change during the integration.
+        """
         # Kinetic Constants
         R = 8.314 / 1000  # kJ/K/mol
         T_ref = 90 + 273.71  # Convert to deg K
         T = T + 273.71  # Convert to deg K
-        conc_cat = C[2]
         A_R = 3.1 * 10 ** 7
         A_S1 = 1 * 10 ** 12
         A_S2 = 3.1 * 10 ** 5
@@ -142,6 +148,10 @@ class MIT_case5(Experiment):
         k_R = k(conc_cat, A_R, E_AR, E_Ai[cat_index], T)
         k_S1 = 0  # k(conc_cat, A_S1, 100, 0 , T)
         k_S2 = 0  # k(conc_cat, A_S2, 50, 0,  T)
+        return k_R, k_S1, k_S2
+
+    def _integrand(self, t, C, k):
+        k_R, k_S1, k_S2 = k
 
         # Reaction Rates
         r = np.zeros(6)
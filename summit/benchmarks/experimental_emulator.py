@@ -12,7 +12,7 @@ import pandas as pd
 import pkg_resources
 import torch
 import torch.nn.functional as F
-from joblib import Parallel
+from joblib import Parallel, parallel_backend
 from numpy.random import default_rng
 from scipy.sparse import issparse
 from sklearn.base import (BaseEstimator, RegressorMixin, TransformerMixin,
@@ -114,6 +114,9 @@ class ExperimentalEmulator(Experiment):
 
     """
 
+    # Predictions for all conditions are made in one call to the predictors
+    batch_run = True
+
     def __init__(self, model_name, domain, **kwargs):
         super().__init__(domain, **kwargs)
         self.model_name = model_name
@@ -144,21 +147,21 @@ class ExperimentalEmulator(Experiment):
     def _run(self, conditions, **kwargs):
         input_columns = [v.name for v in self.domain.input_variables]
         X = conditions[input_columns].to_numpy()
-        if X.shape[0] == len(input_columns):
+        is_series = type(conditions) == pd.Series
+        if is_series:
             X = X[np.newaxis, :]
         X = pd.DataFrame(X, columns=input_columns)
         y_pred, y_pred_std = self._predict(X)
         return_std = kwargs.get("return_std", False)
         for i, name in enumerate(self.output_variable_names):
-            if type(conditions) == pd.Series:
-                y = y_pred[0, i]
-                y_std = y_pred_std[0, i]
+            if is_series:
+                conditions.at[(name, "DATA")] = y_pred[0, i]
+                if return_std:
+                    conditions.at[(f"{name}_std", "METADATA")] = y_pred_std[0, i]
             else:
-                y = y_pred[:, i]
-                y_std = y_pred_std[:, i]
-            conditions.at[(name, "DATA")] = y
-            if return_std:
-                conditions.at[(f"{name}_std", "METADATA")] = y_std
+                conditions[(name, "DATA")] = y_pred[:, i]
+                if return_std:
+                    conditions[(f"{name}_std", "METADATA")] = y_pred_std[:, i]
         return conditions, {}
 
     def _predict(self, X, **kwargs):
@@ -212,6 +215,11 @@ class ExperimentalEmulator(Experiment):
             Skorch callbacks passed to skorch.net. See: https://skorch.readthedocs.io/en/latest/net.html
         verbose : int
             0 for no logging, 1 for logging
+        n_jobs : int, optional
+            The number of jobs used to fit the cross validation folds
+            (and grid search candidates) in parallel. Folds are fit in threads,
+            since fitted skorch nets cannot be sent back from worker processes.
+            -1 uses all processors. Defaults to None (i.e., one job).
 
         Notes
         ------
@@ -271,32 +279,40 @@ class ExperimentalEmulator(Experiment):
         scoring = kwargs.get("scoring", ["r2", "neg_root_mean_squared_error"])
         folds = kwargs.get("cv_folds", 5)
         search_params = kwargs.get("search_params", {})
-        # Run grid search if requested
-        if search_params:
-            self.logger.info("Starting grid search.")
-            gs = ProgressGridSearchCV(
-                predictor, search_params, refit="r2", cv=folds, scoring=scoring
+        n_jobs = kwargs.get("n_jobs")
+        with parallel_backend("threading", n_jobs=n_jobs):
+            # Run grid search if requested
+            if search_params:
+                self.logger.info("Starting grid search.")
+                gs = ProgressGridSearchCV(
+                    predictor,
+                    search_params,
+                    refit="r2",
+                    cv=folds,
+                    scoring=scoring,
+                    n_jobs=n_jobs,
+                )
+                gs.fit(self.X_train, y_train)
+                best_params = gs.best_params_
+                params = {}
+                for param in search_params.keys():
+                    params[param] = best_params[param]
+                predictor.set_params(**params)
+
+            # Run final training using cross validation
+            initializing = kwargs.get("initializing", False)
+
+            if not initializing:
+                self.logger.info("Starting training.")
+            res = cross_validate(
+                predictor,
+                self.X_train,
+                y_train,
+                scoring=scoring,
+                cv=folds,
+                return_estimator=True,
+                n_jobs=n_jobs,
             )
-            gs.fit(self.X_train, y_train)
-            best_params = gs.best_params_
-            params = {}
-            for param in search_params.keys():
-                params[param] = best_params[param]
-            predictor.set_params(**params)
-
-        # Run final training using cross validation
-        initializing = kwargs.get("initializing", False)
-
-        if not initializing:
-            self.logger.info("Starting training.")
-        res = cross_validate(
-            predictor,
-            self.X_train,
-            y_train,
-            scoring=scoring,
-            cv=folds,
-            return_estimator=True,
-        )
 
         self.predictors = res.pop("estimator")
         # Rename from test to validation
@@ -937,42 +953,70 @@ class DescriptorEncoder(StandardScaler):
         super().__init__(copy=copy, with_mean=with_mean, with_std=with_std)
 
     def fit(self, X, y=None, sample_weight=None):
-        X_new = self._cat_to_descriptor(X, self.datasets)
+        X_new = self._cat_to_descriptor(X, self._descriptor_tables())
         return super().fit(X_new, y=y, sample_weight=sample_weight)
 
     def transform(self, X, copy=None):
-        X_new = self._cat_to_descriptor(X, self.datasets)
+        X_new = self._cat_to_descriptor(X, self._descriptor_tables())
         return super().transform(X_new, copy=copy)
 
+    def fit_transform(self, X, y=None, sample_weight=None):
+        # Convert to descriptors once instead of separately in fit and transform
+        X_new = self._cat_to_descriptor(X, self._descriptor_tables())
+        super().fit(X_new, y=y, sample_weight=sample_weight)
+        return super().transform(X_new)
+
     def inverse_transform(self, X, copy=None):
         raise NotImplementedError(
             "Inverse transform not implemented for DescriptorsEncoder"
         )
 
+    def _descriptor_tables(self):
+        """Index and descriptor array of each dataset
+
+        These are only rebuilt when a dataset in datasets is added, removed or
+        replaced, so transform does not need to go through pandas indexing on
+        every call. Editing the values of a dataset in place is not detected.
+        """
+        key = tuple(id(ds) for ds in self.datasets)
+        if getattr(self, "_tables_key", None) != key:
+            self._tables = [
+                (ds.index, np.asarray(ds.data_to_numpy(), dtype=np.float64))
+                for ds in self.datasets
+            ]
+            # Keep the datasets alive so that their ids cannot be reused
+            self._tables_source = tuple(self.datasets)
+            self._tables_key = key
+        return self._tables
+
     @staticmethod
-    def _cat_to_descriptor(X, datasets):
+    def _cat_to_descriptor(X, tables):
         """Convert categorical variables into descriptors
 
         Parameters
         ----------
         X : np.ndarray
             An array of labels to be converted to descriptors
-        datasets : list of DataSet
-            The dataset in datasets[i] should contain an index
-            matching the label in column i of X.
+        tables : list of tuple
+            Tuples of (index, descriptors) where index is the index of a descriptors
+            DataSet and descriptors is its data columns as an array. The index in
+            tables[i] should contain the labels in column i of X.
         """
 
-        n_descriptors = sum([len(ds.data_columns) for ds in datasets])
+        n_descriptors = sum([descriptors.shape[1] for _, descriptors in tables])
         X_new = np.zeros([X.shape[0], n_descriptors])
         col = 0
-        for i, ds in enumerate(datasets):
+        for i, (index, descriptors) in enumerate(tables):
             if type(X) == pd.DataFrame:
                 labels = X.iloc[:, i]
             else:
                 labels = X[:, i]
-            descriptors = ds.loc[labels, :].data_to_numpy()
+            rows = index.get_indexer(labels)
+            if (rows < 0).any():
+                missing = np.unique(np.asarray(labels)[rows < 0]).tolist()
+                raise KeyError(f"{missing} not in the descriptors index.")
             n_descriptors = descriptors.shape[1]
-            X_new[:, col : col + n_descriptors] = descriptors
+            X_new[:, col : col + n_descriptors] = descriptors[rows]
             col += n_descriptors
         return X_new
 
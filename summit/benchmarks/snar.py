@@ -107,21 +107,23 @@ class SnarBenchmark(Experiment):
 
     def _integrate_equations(self, tau, equiv_pldn, conc_dfnb, temperature, **kwargs):
         # Initial Concentrations in mM
-        self.C_i = np.zeros(5)
-        self.C_i[0] = conc_dfnb
-        self.C_i[1] = equiv_pldn * conc_dfnb
+        C_i = np.zeros(5)
+        C_i[0] = conc_dfnb
+        C_i[1] = equiv_pldn * conc_dfnb
 
         # Flowrate and residence time
         V = 5  # mL
         q_tot = V / tau
         C1_0 = kwargs.get("C1_0", 2.0)  # reservoir concentration of 1 is 1 M = 1 mM
         C2_0 = kwargs.get("C2_0", 4.2)  # reservoir concentration of  2 is 2 M = 2 mM
-        q_1 = self.C_i[0] / C1_0 * q_tot  # flowrate of 1 (dfnb)
-        q_2 = self.C_i[1] / C2_0 * q_tot  # flowrate of 2 (pldn)
+        q_1 = C_i[0] / C1_0 * q_tot  # flowrate of 1 (dfnb)
+        q_2 = C_i[1] / C2_0 * q_tot  # flowrate of 2 (pldn)
         q_eth = q_tot - q_1 - q_2  # flowrate of ethanol
 
         # Integrate
-        res = solve_ivp(self._integrand, [0, tau], self.C_i, args=(temperature,))
+        # Rate constants only depend on temperature, so compute them once
+        k = self._rate_constants(temperature)
+        res = solve_ivp(self._integrand, [0, tau], C_i, args=(k, C_i))
         C_final = res.y[:, -1]
 
         # Add measurment noise
@@ -149,26 +151,25 @@ class SnarBenchmark(Experiment):
 
         return sty, e_factor, {}
 
-    def _integrand(self, t, C, T):
+    @staticmethod
+    def _rate_constants(T):
         # Kinetic Constants
         R = 8.314 / 1000  # kJ/K/mol
         T_ref = 90 + 273.71  # Convert to deg K
         T = T + 273.71  # Convert to deg K
         # Need to convert from 10^-2 M^-1s^-1 to M^-1min^-1
-        k = (
-            lambda k_ref, E_a, temp: 0.6
-            * k_ref
-            * np.exp(-E_a / R * (1 / temp - 1 / T_ref))
-        )
-        k_a = k(57.9, 33.3, T)
-        k_b = k(2.70, 35.3, T)
-        k_c = k(0.865, 38.9, T)
-        k_d = k(1.63, 44.8, T)
+        k_ref = np.array([57.9, 2.70, 0.865, 1.63])
+        E_a = np.array([33.3, 35.3, 38.9, 44.8])
+        k = 0.6 * k_ref * np.exp(-E_a / R * (1 / T - 1 / T_ref))
+        return tuple(k.tolist())
+
+    def _integrand(self, t, C, k, C_i):
+        k_a, k_b, k_c, k_d = k
 
         # Reaction Rates
         r = np.zeros(5)
         for i in [0, 1]:  # Set to reactants when close
-            C[i] = 0 if C[i] < 1e-6 * self.C_i[i] else C[i]
+            C[i] = 0 if C[i] < 1e-6 * C_i[i] else C[i]
         r[0] = -(k_a + k_b) * C[0] * C[1]
         r[1] = -(k_a + k_b) * C[0] * C[1] - k_c * C[1] * C[2] - k_d * C[1] * C[3]
         r[2] = k_a * C[0] * C[1] - k_c * C[1] * C[2]
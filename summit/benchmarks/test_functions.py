@@ -73,12 +73,14 @@ class Himmelblau(Experiment):
         x_2 = float(conditions["x_2"])
         y = eval(self.equation)
         conditions[("y", "DATA")] = y
+        return conditions, None
 
+    def _after_run(self, result):
         # save evaluated points for plotting
+        x_1 = float(result["x_1"].iloc[0])
+        x_2 = float(result["x_2"].iloc[0])
         self.evaluated_points.append([x_1, x_2])
 
-        return conditions, None
-
     def plot(self, ax=None, **kwargs):
         """Make a plot of the experiments evaluated thus far
 
@@ -284,12 +286,16 @@ class Hartmann3D(Experiment):
 
         y = function_evaluation(x_1, x_2, x_3)
         conditions[("y", "DATA")] = y
+        return conditions, None
 
+    def _after_run(self, result):
         # save evaluated points for plotting
+        x_1 = float(result["x_1"].iloc[0])
+        x_2 = float(result["x_2"].iloc[0])
+        x_3 = float(result["x_3"].iloc[0])
+        y = float(result["y"].iloc[0])
         self.evaluated_points.append([x_1, x_2, x_3, y])
 
-        return conditions, None
-
     def plot(self, ax=None, **kwargs):
         """Make a plot of the experiments evaluated thus far
 
@@ -468,12 +474,14 @@ class ThreeHumpCamel(Experiment):
         x_2 = float(conditions["x_2"])
         y = eval(self.equation)
         conditions[("y", "DATA")] = y
+        return conditions, None
 
+    def _after_run(self, result):
         # save evaluated points for plotting
+        x_1 = float(result["x_1"].iloc[0])
+        x_2 = float(result["x_2"].iloc[0])
         self.evaluated_points.append([x_1, x_2])
 
-        return conditions, None
-
     def plot(self, ax=None, **kwargs):
         """Make a plot of the experiments evaluated thus far
 
@@ -751,24 +751,24 @@ def fullfact(levels):
         The design matrix with coded levels 0 to k-1 for a k-level factor
 
 
+    Examples
+    --------
+    >>> fullfact([2, 3])
+    array([[0., 0.],
+           [1., 0.],
+           [0., 1.],
+           [1., 1.],
+           [0., 2.],
+           [1., 2.]])
+
     Notes
     ------
-    This code is copied from pydoe2: https://github.com/clicumu/pyDOE2/blob/master/pyDOE2/doe_factorial.py
+    This code is adapted from pydoe2: https://github.com/clicumu/pyDOE2/blob/master/pyDOE2/doe_factorial.py
 
     """
     n = len(levels)  # number of factors
-    nb_lines = np.prod(levels)  # number of trial conditions
-    H = np.zeros((nb_lines, n))
-
-    level_repeat = 1
-    range_repeat = np.prod(levels)
-    for i in range(n):
-        range_repeat //= levels[i]
-        lvl = []
-        for j in range(levels[i]):
-            lvl += [j] * level_repeat
-        rng = lvl * range_repeat
-        level_repeat *= levels[i]
-        H[:, i] = rng
-
-    return H
+    nb_lines = int(np.prod(levels))  # number of trial conditions
+
+    # Unravel the trial numbers in Fortran order so the first factor changes fastest
+    H = np.unravel_index(np.arange(nb_lines), levels, order="F")
+    return np.array(H, dtype=float).reshape(n, nb_lines).T
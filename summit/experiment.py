@@ -6,6 +6,8 @@ from summit.utils.dataset import DataSet
 from summit.utils.multiobjective import pareto_efficient
 from summit.utils import jsonify_dict, unjsonify_dict
 
+from copy import copy
+from joblib import Parallel, delayed
 import pandas as pd
 import numpy as np
 import time
@@ -42,8 +44,19 @@ class Experiment(ABC):
     Developers that subclass `Experiment` need to implement
     `_run`, which runs the experiments.
 
+    If `_run` can evaluate a whole DataSet of conditions in one call,
+    set the class attribute `batch_run` to True. `run_experiments` will
+    then pass all the conditions at once instead of looping over them.
+
+    `_run` may be called concurrently when `run_experiments` is given
+    `n_jobs`, so it should not modify the experiment's state. Per-experiment
+    bookkeeping (e.g., points stored for plotting) belongs in `_after_run`,
+    which is always called serially in the order of the conditions.
+
     """
 
+    batch_run = False
+
     def __init__(self, domain, **kwargs):
         self.logger = kwargs.get("logger", logging.getLogger(__name__))
         self._domain = domain
@@ -60,7 +73,7 @@ class Experiment(ABC):
         self._data = self._data.reset_index(drop=True)
         return self._data
 
-    def run_experiments(self, conditions, computation_time=None, **kwargs):
+    def run_experiments(self, conditions, computation_time=None, n_jobs=1, **kwargs):
         """Run the experiment(s) at the given conditions
 
         Parameters
@@ -72,6 +85,16 @@ class Experiment(ABC):
         computation_time: float, optional
             The time used by the strategy in calculating the next experiments.
             By default, the time since the last call to run_experiment is used.
+        n_jobs: int, optional
+            The number of experiments to run concurrently. Experiments are always
+            run in threads (even inside a joblib process backend context), so
+            they share the experiment's state, e.g. its random generator. This
+            only speeds things up when `_run` is I/O-bound or releases the GIL
+            (e.g., waits on an instrument); pure Python and small NumPy
+            calculations will not get faster. -1 uses all processors.
+            Defaults to 1 (i.e., run experiments sequentially).
+            Ignored when `batch_run` is True, since all the conditions are then
+            passed to `_run` in a single call.
 
         """
         # Bookeeping for time used by strategy when suggesting next experiment
@@ -82,22 +105,51 @@ class Experiment(ABC):
         elif self.prev_itr_time is None:
             diff = 0
 
+        # Nothing to run
+        if len(conditions) == 0:
+            return self._data.iloc[0:0]
+
         # Run experiments
-        # TODO: Add an option to run these in parallel
-        for i, condition in conditions.iterrows():
-            start = time.time()
-            res, extras = self._run(condition, **kwargs)
-            experiment_time = time.time() - start
+        if self.batch_run:
+            return self._run_batch(conditions, diff, **kwargs)
+        rows = [condition for _, condition in conditions.iterrows()]
+        results = Parallel(n_jobs=n_jobs, require="sharedmem")(
+            delayed(self._timed_run)(condition, **kwargs) for condition in rows
+        )
+        # Collect results and concatenate once, since each concat copies all previous data
+        new_data = []
+        for condition, (res, extras, experiment_time) in zip(rows, results):
+            self._after_run(res)
             res = DataSet(res).T
-            self._data = pd.concat([self._data, res], axis=0)
-            self._data["experiment_t"].iat[-1] = float(experiment_time)
-            self._data["computation_t"].iat[-1] = float(diff)
+            res[("experiment_t", "METADATA")] = float(experiment_time)
+            res[("computation_t", "METADATA")] = float(diff)
             if condition.get("strategy") is not None:
-                self._data["strategy"].iat[-1] = condition.get("strategy").values[0]
+                res[("strategy", "METADATA")] = condition.get("strategy").values[0]
+            new_data.append(res)
             self.extras.append(extras)
+        self._data = pd.concat([self._data] + new_data, axis=0)
         self.prev_itr_time = time.time()
         return self._data.iloc[-len(conditions) :]
 
+    def _run_batch(self, conditions, computation_time, **kwargs):
+        n_experiments = len(conditions)
+        res, extras, experiment_time = self._timed_run(conditions.copy(), **kwargs)
+        res = DataSet(res)
+        for _, row in res.iterrows():
+            self._after_run(row)
+        # Time is not available per experiment, so split it evenly across the batch
+        res[("experiment_t", "METADATA")] = float(experiment_time) / n_experiments
+        res[("computation_t", "METADATA")] = float(computation_time)
+        self._data = pd.concat([self._data, res], axis=0)
+        self.extras.extend([copy(extras) for _ in range(n_experiments)])
+        self.prev_itr_time = time.time()
+        return self._data.iloc[-n_experiments:]
+
+    def _timed_run(self, conditions, **kwargs):
+        start = time.time()
+        res, extras = self._run(conditions, **kwargs)
+        return res, extras, time.time() - start
+
     @abstractmethod
     def _run(self, conditions, **kwargs):
         """Run experiments at the specified conditions.
@@ -119,6 +171,19 @@ class Experiment(ABC):
 
         raise NotImplementedError("_run be implemented by subclasses of Experiment")
 
+    def _after_run(self, result):
+        """Record state about a single finished experiment.
+
+        Called serially, in the order of the conditions, with the
+        result returned by `_run` for each experiment. Does nothing by default.
+
+        Arguments
+        ---------
+        result: pandas.Series
+            The conditions and results of one experiment.
+        """
+        pass
+
     def reset(self):
         """Reset the experiment
 
@@ -1,12 +1,16 @@
 import pytest
 from summit.domain import *
 from summit.benchmarks import *
+from summit.benchmarks.experimental_emulator import DescriptorEncoder
+from summit.experiment import Experiment
 from summit.utils.dataset import DataSet
 import numpy as np
 import pandas as pd
 import os
 import pathlib
 import shutil
+import time
+from joblib import parallel_backend
 import pkg_resources
 import matplotlib.pyplot as plt
 
@@ -67,9 +71,9 @@ def test_train_experimental_emulator():
     # Test saving/loading
     exp.save("test_ee")
     exp_2 = ExperimentalEmulator.load(model_name, "test_ee")
-    assert all(exp.descriptors_features) == all(exp_2.descriptors_features)
+    assert exp.descriptors_features == exp_2.descriptors_features
     assert exp.n_examples == exp_2.n_examples
-    assert all(exp.output_variable_names) == all(exp_2.output_variable_names)
+    assert exp.output_variable_names == exp_2.output_variable_names
     assert exp.clip == exp_2.clip
     exp_2.X_train, exp_2.y_train, exp_2.X_test, exp_2.y_test = (
         exp.X_train,
@@ -84,6 +88,31 @@ def test_train_experimental_emulator():
     shutil.rmtree("test_ee")
 
 
+def test_train_experimental_emulator_parallel():
+    """Test fitting the cross validation folds in parallel"""
+    model_name = f"reizman_suzuki_case_1"
+    domain = ReizmanSuzukiEmulator.setup_domain()
+    ds = DataSet.read_csv(DATA_PATH / f"{model_name}.csv")
+    exp = ExperimentalEmulator(model_name, domain, dataset=ds, regressor=ANNRegressor)
+    res = exp.train(cv_folds=3, max_epochs=5, random_state=100, verbose=0, n_jobs=2)
+    assert len(exp.predictors) == 3
+    assert len(res["val_r2"]) == 3
+    exp.run_experiments(ds[[v.name for v in domain.input_variables]].iloc[:2])
+
+
+def test_descriptor_encoder():
+    ds = DataSet([[1.0, 2.0], [3.0, 4.0]], index=["a", "b"], columns=["d_1", "d_2"])
+    enc = DescriptorEncoder(datasets=[ds], with_mean=False, with_std=False)
+    X = np.array([["b"], ["a"]])
+    assert np.array_equal(enc.fit_transform(X), [[3.0, 4.0], [1.0, 2.0]])
+
+    # Replacing a dataset in place is picked up
+    enc.datasets[0] = DataSet(
+        [[5.0, 6.0], [7.0, 8.0]], index=["a", "b"], columns=["d_1", "d_2"]
+    )
+    assert np.array_equal(enc.fit_transform(X), [[7.0, 8.0], [5.0, 6.0]])
+
+
 def test_reizman_emulator(show_plots=False):
     b = get_pretrained_reizman_suzuki_emulator(case=1)
     b.parity_plot(include_test=True)
@@ -165,4 +194,77 @@ def test_no_objectives():
     domain += ContinuousVariable("x", "", bounds=[0, 1])
 
     with pytest.raises(DomainError):
-        ExperimentalEmulator("test", domain)
\ No newline at end of file
+        ExperimentalEmulator("test", domain)
+
+
+class SleepExperiment(Experiment):
+    """Experiment that waits for x seconds and returns y = x"""
+
+    def __init__(self, **kwargs):
+        domain = Domain()
+        domain += ContinuousVariable(name="x", description="wait", bounds=[0, 1])
+        domain += ContinuousVariable(
+            name="y", description="result", bounds=[0, 1], is_objective=True
+        )
+        super().__init__(domain, **kwargs)
+
+    def _run(self, conditions, **kwargs):
+        x = float(conditions["x"].iloc[0])
+        time.sleep(x)
+        conditions[("y", "DATA")] = x
+        return conditions, {"x": x, "pid": os.getpid()}
+
+
+def test_run_experiments_parallel():
+    """Test running a batch of experiments concurrently"""
+    # Longest experiments first, so they finish in the reverse order
+    x = [0.4, 0.3, 0.2, 0.1]
+    ds = DataSet({("x", "DATA"): x})
+    exp = SleepExperiment()
+    start = time.time()
+    res = exp.run_experiments(ds, n_jobs=4)
+    elapsed = time.time() - start
+    assert elapsed < sum(x)
+    assert np.allclose(res["y"].to_numpy(), x)
+    assert [e["x"] for e in exp.extras] == x
+
+    # Experiments stay in this process even if a process backend is requested
+    with parallel_backend("loky"):
+        exp.run_experiments(ds, n_jobs=4)
+    assert all(e["pid"] == os.getpid() for e in exp.extras)
+
+    # Bookkeeping is done in the order of the conditions
+    b = Himmelblau()
+    rng = np.random.default_rng(100)
+    values = {(f"x_{i}", "DATA"): rng.uniform(-4, 4, size=8) for i in range(1, 3)}
+    ds = DataSet(values)
+    sequential = b.run_experiments(ds.copy())
+    parallel = b.run_experiments(ds.copy(), n_jobs=2)
+    assert len(b.data) == 16
+    assert np.allclose(sequential["y"].to_numpy(), parallel["y"].to_numpy())
+    assert np.allclose(
+        b.evaluated_points, b.data[["x_1", "x_2"]].to_numpy().astype(float)
+    )
+
+
+def test_emulator_batch_run():
+    """Test that a batch of conditions gives the same result as running them one by one"""
+    b = get_pretrained_reizman_suzuki_emulator(case=1)
+    values = {
+        "catalyst": ["P1-L3", "P1-L1", "P2-L1"],
+        "t_res": [600, 60, 300],
+        "temperature": [30, 110, 70],
+        "catalyst_loading": [0.498, 2.5, 1.0],
+    }
+    conditions = DataSet.from_df(pd.DataFrame(values))
+    batch = b.run_experiments(conditions, return_std=True)
+    assert len(batch) == 3
+    for i in range(3):
+        single = b.run_experiments(conditions.iloc[[i]], return_std=True)
+        assert np.isclose(single["yld"].iloc[0], batch["yld"].iloc[i])
+        assert np.isclose(single["ton"].iloc[0], batch["ton"].iloc[i])
+    assert len(b.data) == 6
+
+    # An empty set of conditions runs nothing
+    assert len(b.run_experiments(conditions.iloc[0:0])) == 0
+    assert len(b.data) == 6
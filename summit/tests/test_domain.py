@@ -1,5 +1,6 @@
 from summit.domain import *
 from summit.utils.dataset import DataSet
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -42,7 +43,7 @@ def test_continuous_variable():
     assert var.description == new_var.description
     assert var.lower_bound == new_var.lower_bound
     assert var.upper_bound == new_var.upper_bound
-    assert var.bounds.all() == new_var.bounds.all()
+    assert np.array_equal(var.bounds, new_var.bounds)
     assert var.is_objective == new_var.is_objective
     assert var.maximize == new_var.maximize
 
@@ -98,7 +99,7 @@ def test_categorical_variable():
     assert isinstance(var, Variable)
     assert var.name == "solvent"
     assert var.description == "solvent descriptors"
-    assert all(var.ds) == all(solvent_ds)
+    assert var.ds.equals(solvent_ds)
     assert var.num_levels == 2
 
     # Test serialization
@@ -106,7 +107,7 @@ def test_categorical_variable():
     new_var = CategoricalVariable.from_dict(ser)
     assert var.name == new_var.name
     assert var.description == new_var.description
-    assert all(var.ds) == all(new_var.ds)
+    assert var.ds.equals(new_var.ds)
 
 
 def test_constraint():
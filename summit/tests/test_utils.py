@@ -1,5 +1,7 @@
 import pytest
 from summit import DataSet
+import numpy as np
+import pandas as pd
 
 
 def test_dataset():
@@ -10,9 +12,9 @@ def test_dataset():
     # Using arrays
     values = [[1.5, 0.5, 0.1, 30.0, "test"]]
     ds = DataSet(values, columns=columns, metadata_columns="strategy")
-    assert all(ds.columns.get_level_values("NAME").tolist()) == all(columns)
-    assert all(ds.data_columns) == all(data_columns)
-    assert all(ds.metadata_columns) == all(metadata_columns)
+    assert ds.columns.get_level_values("NAME").tolist() == columns
+    assert ds.data_columns == data_columns
+    assert ds.metadata_columns == metadata_columns
 
     # Test creating datset with dictionary
     values = {
@@ -23,6 +25,25 @@ def test_dataset():
         ("strategy", "METADATA"): ["test", "test"],
     }
     ds = DataSet(values)
-    assert all(ds.columns.get_level_values("NAME").tolist()) == all(columns)
-    assert all(ds.data_columns) == all(data_columns)
-    assert all(ds.metadata_columns) == all(metadata_columns)
+    assert ds.columns.get_level_values("NAME").tolist() == columns
+    assert ds.data_columns == data_columns
+    assert ds.metadata_columns == metadata_columns
+
+    # Metadata columns should be removed when converting to numpy
+    values = ds.data_to_numpy()
+    assert values.shape == (2, 4)
+    assert values.dtype == np.float64
+
+    # Test standardization with calculated and passed statistics
+    standard, mean, std = ds.standardize(return_mean=True, return_std=True)
+    assert np.allclose(standard, (values - values.mean(axis=0)) / values.std(axis=0))
+    assert np.allclose(ds.standardize(mean=mean, std=std), standard)
+
+    # Columns passed as a MultiIndex without level names
+    columns = pd.MultiIndex.from_tuples(
+        [("a", "DATA"), ("b", "DATA"), ("s", "METADATA")]
+    )
+    ds = DataSet([[1.0, 2.0, "x"], [3.0, 5.0, "y"]], columns=columns)
+    assert np.array_equal(ds.data_to_numpy(), [[1.0, 2.0], [3.0, 5.0]])
+    assert ds.standardize().shape == (2, 2)
+    assert ds.zero_to_one().shape == (2, 2)
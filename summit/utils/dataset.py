@@ -200,12 +200,12 @@ class DataSet(pd.core.frame.DataFrame):
         This method does not change the internal values of the data columns in place.
 
         """
-        values = self.data_to_numpy()
-        values = values.astype(np.float64)
+        values = np.asarray(self.data_to_numpy(), dtype=np.float64)
         maxes = np.max(values, axis=0)
         mins = np.min(values, axis=0)
         ranges = maxes - mins
-        scaled = (values - mins) / ranges
+        scaled = values - mins
+        scaled /= ranges
         scaled[abs(scaled) < small_tol] = 0.0
         if return_min_max:
             return scaled, mins, maxes
@@ -250,12 +250,18 @@ class DataSet(pd.core.frame.DataFrame):
         This method does not change the internal values of the data columns in place.
 
         """
-        values = self.data_to_numpy()
-        values = values.astype(np.float64)
-
-        mean = kwargs.get("mean", np.mean(values, axis=0))
-        sigma = kwargs.get("std", np.std(values, axis=0))
-        standard = (values - mean) / sigma
+        # Only copies if the data columns are not already float64
+        values = np.asarray(self.data_to_numpy(), dtype=np.float64)
+
+        # Only compute the statistics when they are not passed in
+        mean = kwargs.get("mean")
+        if mean is None:
+            mean = np.mean(values, axis=0)
+        sigma = kwargs.get("std")
+        if sigma is None:
+            sigma = np.std(values, axis=0)
+        standard = values - mean
+        standard /= sigma
         standard[abs(standard) < small_tol] = 0.0
         if return_mean and return_std:
             return standard, mean, sigma
@@ -299,16 +305,14 @@ class DataSet(pd.core.frame.DataFrame):
             return newdf._repr_html_()
         return super()._repr_html_()
 
-    def data_to_numpy(self) -> int:
+    def data_to_numpy(self) -> np.ndarray:
         """Return dataframe with the metadata columns removed"""
-        result = super().to_numpy()
-        metadata_columns = []
-        for i, column in enumerate(self.columns):
-            if column[1] == "METADATA":
-                metadata_columns.append(i)
-        mask = np.ones(len(self.columns), dtype=bool)
-        mask[metadata_columns] = False
-        return result[:, mask]
+        # Drop metadata before converting, so that (often string) metadata
+        # columns do not force the data into an object array. The type is
+        # looked up by position, like in data_columns, since the levels of a
+        # MultiIndex passed in as columns are not necessarily named.
+        mask = self.columns.get_level_values(1) != "METADATA"
+        return self.iloc[:, mask].to_numpy()
 
     @property
     def metadata_columns(self):